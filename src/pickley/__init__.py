@@ -2,7 +2,6 @@ import hashlib
 import logging
 import os
 import platform
-import re
 import sys
 import time
 from datetime import datetime
@@ -649,7 +648,7 @@ class PickleyConfig:
         if given_package_spec.startswith("http"):
             given_package_spec = f"git+{given_package_spec}"
 
-        if re.match(r"^(file:|https?:|git[@+])", given_package_spec):
+        if given_package_spec.startswith(("file:", "http:", "https:", "git@", "git+")):
             return given_package_spec
 
         if given_package_spec.startswith(".") or "/" in given_package_spec:
@@ -87,6 +87,9 @@ class SoftLock:
                 if not runez.check_pid(pid):
                     return None  # PID is no longer active
 
+            if pid is not None:
+                return f"(pid {pid})"  # Holder was invoked without any CLI args, lock is still held
+
     def __enter__(self):
         """Acquire lock"""
         if self.lock_path:
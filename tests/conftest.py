@@ -30,7 +30,14 @@ class TemporaryBase(runez.TempFolder):
         super(TemporaryBase, self).__enter__()
         os.environ["PICKLEY_ROOT"] = self.tmp_folder
         # Provide a `uv` binary out-of-the-box so that tests don't have to bootstrap uv over and over
-        runez.copy(TEST_UV.uv_path, os.path.join(self.tmp_folder, "uv"), logger=None)
+        # Hardlinked: `uv` is only ever replaced (never modified in place), this avoids copying a ~40MB file for every test
+        uv_path = os.path.join(self.tmp_folder, "uv")
+        try:
+            os.link(TEST_UV.uv_path, uv_path)
+
+        except OSError:  # pragma: no cover, happens only if build/ and temp folders are on different devices
+            runez.copy(TEST_UV.uv_path, uv_path, logger=None)
+
         runez.touch(os.path.join(self.tmp_folder, ".pk/.cache/uv.cooldown"), logger=None)
         runez.save_json({"vpickley": "0.0.0"}, ".pk/.manifest/.bootstrap.json", logger=None)
         CFG.reset()
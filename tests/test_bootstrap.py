@@ -9,6 +9,7 @@ from pickley import bstrap, Reporter
 from pickley.cli import CFG
 
 
+@pytest.mark.functional
 def test_bootstrap_command(cli):
     cli.run("-n", "bootstrap", ".local/bin", cli.project_folder)
     assert cli.failed
@@ -35,6 +36,7 @@ def test_bootstrap_command(cli):
     assert CFG.program_version(".local/bin/pickley")
 
 
+@pytest.mark.functional
 def test_bootstrap_script(cli, monkeypatch):
     # Ensure changes to bstrap.py globals are restored
     cli.main = bstrap.main
@@ -106,13 +108,13 @@ def test_bootstrap_script(cli, monkeypatch):
     info = runez.read_json(".local/bin/.pk/.manifest/.bootstrap.json")
     assert info["vpickley"]
     assert f"Seeding .config/pip/pip.conf with {mirror}" in cli.logged
-    assert list(runez.readlines(".config/pip/pip.conf")) == ["[global]", f"index-url = {mirror}"]
-    assert list(runez.readlines(".local/bin/.pk/config.json")) == ["{", f"  {sample_config}", "}"]
+    assert Path(".config/pip/pip.conf").read_text().splitlines() == ["[global]", f"index-url = {mirror}"]
+    assert Path(".local/bin/.pk/config.json").read_text().splitlines() == ["{", f"  {sample_config}", "}"]
 
     if bstrap.USE_UV:
         uv_config = ".config/uv/uv.toml"
         assert f"Seeding {uv_config} with {mirror}" in cli.logged
-        assert list(runez.readlines(uv_config)) == ["[pip]", f'index-url = "{mirror}"']
+        assert Path(uv_config).read_text().splitlines() == ["[pip]", f'index-url = "{mirror}"']
 
         # Now verify that uv works with the seeded file
         monkeypatch.setenv("UV_CONFIG_FILE", uv_config)
@@ -1,3 +1,4 @@
+import pytest
 import runez
 
 from pickley import bstrap, CFG
@@ -66,6 +67,7 @@ def test_bogus_config(temp_cfg):
     assert actual == expected
 
 
+@pytest.mark.functional
 def test_good_config(cli):
     grab_sample("good-config")
 
@@ -86,9 +88,15 @@ def test_good_config(cli):
     assert "Would wrap mgit -> .pk/mgit-1.2.1/bin/mgit" in cli.logged
 
 
-def test_despecced():
-    assert CFG.despecced("mgit") == ("mgit", None)
-    assert CFG.despecced("mgit==1.0.0") == ("mgit", "1.0.0")
-    assert CFG.despecced(" mgit == 1.0.0 ") == ("mgit", "1.0.0")
-    assert CFG.despecced("mgit==") == ("mgit", None)
-    assert CFG.despecced(" mgit == ") == ("mgit", None)
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("mgit", ("mgit", None)),
+        ("mgit==1.0.0", ("mgit", "1.0.0")),
+        (" mgit == 1.0.0 ", ("mgit", "1.0.0")),
+        ("mgit==", ("mgit", None)),
+        (" mgit == ", ("mgit", None)),
+    ],
+)
+def test_despecced(text, expected):
+    assert CFG.despecced(text) == expected
@@ -1,8 +1,10 @@
 import sys
 
+import pytest
 import runez
 
 
+@pytest.mark.functional
 def test_describe(cli):
     cli.run("describe pickley==1.0")
     assert cli.succeeded
@@ -18,33 +20,6 @@ def test_describe(cli):
     assert "Applying bake_time of 5 minutes" in cli.logged.stdout
 
     runez.delete(".pk/config.json", logger=None)
-    if sys.version_info[:2] >= (3, 10):
-        cli.run("describe .")
-        assert cli.failed
-        assert "problem: " in cli.logged.stdout
-
-        cli.run("-vv describe uv")
-        assert cli.succeeded
-        assert "pip show" not in cli.logged
-        assert "bake_time" not in cli.logged
-        assert "(package spec resolved by uv)" in cli.logged.stdout
-
-        cli.run("-vv describe tox-uv")
-        assert cli.succeeded
-        assert "pip show" in cli.logged.stdout
-        assert "tox-uv: version " in cli.logged.stdout
-        assert "entry-points: tox\n" in cli.logged.stdout
-
-        cli.run("describe https://github.com/codrsquad/pickley.git")
-        assert cli.succeeded
-        assert "entry-points: pickley" in cli.logged.stdout
-
-        runez.write(".pk/config.json", '{"pinned": {"ansible": "10.4.0"}}', logger=None)
-        cli.run("describe ansible")
-        assert cli.succeeded
-        assert "ansible: version 10.4.0 (pinned by configuration resolved by uv)\n" in cli.logged.stdout
-        assert "entry-points: ansible, ansible-config, " in cli.logged.stdout
-
     cli.run("describe", cli.project_folder)
     assert cli.succeeded
     assert "pickley: version " in cli.logged.stdout
@@ -60,3 +35,33 @@ def test_describe(cli):
     cli.run("describe six")
     assert cli.succeeded
     assert "entry-points: six" in cli.logged.stdout
+
+
+@pytest.mark.functional
+@pytest.mark.skipif(sys.version_info[:2] < (3, 10), reason="Some of the packages described here require python3.10+")
+def test_describe_py310(cli):
+    cli.run("describe .")
+    assert cli.failed
+    assert "problem: " in cli.logged.stdout
+
+    cli.run("-vv describe uv")
+    assert cli.succeeded
+    assert "pip show" not in cli.logged
+    assert "bake_time" not in cli.logged
+    assert "(package spec resolved by uv)" in cli.logged.stdout
+
+    cli.run("-vv describe tox-uv")
+    assert cli.succeeded
+    assert "pip show" in cli.logged.stdout
+    assert "tox-uv: version " in cli.logged.stdout
+    assert "entry-points: tox\n" in cli.logged.stdout
+
+    cli.run("describe https://github.com/codrsquad/pickley.git")
+    assert cli.succeeded
+    assert "entry-points: pickley" in cli.logged.stdout
+
+    runez.write(".pk/config.json", '{"pinned": {"ansible": "10.4.0"}}', logger=None)
+    cli.run("describe ansible")
+    assert cli.succeeded
+    assert "ansible: version 10.4.0 (pinned by configuration resolved by uv)\n" in cli.logged.stdout
+    assert "entry-points: ansible, ansible-config, " in cli.logged.stdout
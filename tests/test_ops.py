@@ -1,4 +1,5 @@
 import os
+import runpy
 import sys
 import time
 from pathlib import Path
@@ -37,6 +38,7 @@ def test_base(cli, monkeypatch):
     assert find_base() == CFG.resolved_path("temp-base")
 
 
+@pytest.mark.functional
 def test_dev_mode(cli, monkeypatch):
     runez.ensure_folder("dev_mode", logger=None)
     monkeypatch.setenv("PICKLEY_ROOT", "dev_mode")
@@ -57,6 +59,7 @@ def test_edge_cases(temp_cfg, logged):
     assert os.path.isdir("share")
 
 
+@pytest.mark.functional
 def test_facultative(cli):
     cli.run("-n check virtualenv")
     assert cli.failed
@@ -143,6 +146,7 @@ def test_facultative(cli):
     assert "virtualenv is not installed by pickley, please uninstall it first" in cli.logged
 
 
+@pytest.mark.functional
 def test_install_pypi(cli):
     cli.run("check")
     assert cli.succeeded
@@ -186,8 +190,10 @@ def test_install_pypi(cli):
     runez.touch(".pk/mgit-/bin/mgit", logger=None)  # Simulate a buggy old installation
     runez.touch(".pk/mgit-0.9rc5+local/bin/mgit", logger=None)
     runez.touch(".pk/mgit-1.0/bin/mgit", logger=None)
-    time.sleep(0.1)
     runez.touch(".pk/mgit-1.1/bin/mgit", logger=None)
+    past = time.time() - 10
+    for folder in (".pk/mgit-", ".pk/mgit-0.9rc5+local", ".pk/mgit-1.0"):
+        os.utime(folder, (past, past))  # Make these older than mgit-1.1 (grooming goes by folder mtime)
     cli.run("--no-color -vv install mgit<1.3.0")
     assert cli.succeeded
     assert "Installed mgit v1.2.1" in cli.logged
@@ -292,6 +298,7 @@ def test_install_pypi(cli):
     assert "This command applies only to bootstrapped pickley installations" in cli.logged
 
 
+@pytest.mark.functional
 def test_invalid(cli):
     cli.run("-P10.1 check six")
     assert cli.failed
@@ -331,9 +338,10 @@ def test_lock(temp_cfg, monkeypatch):
     with SoftLock("foo", give_up=600) as lock:
         assert str(lock) == "lock foo"
         assert os.path.exists(lock_path)
+        monkeypatch.setattr(time, "sleep", lambda _: None)  # Don't wait on real time while polling for the lock
         with pytest.raises(SoftLockException, match="giving up"):
-            # Try to grab same lock a seconds time, give up after 1 second
-            with SoftLock("foo", give_up=1, invalid=600):
+            # Try to grab same lock a seconds time, give up almost immediately
+            with SoftLock("foo", give_up=0.01, invalid=600):
                 raise AssertionError("should not be reached")  # pragma: no cover
 
     assert not os.path.exists(lock_path)  # Check that lock was released
@@ -341,16 +349,28 @@ def test_lock(temp_cfg, monkeypatch):
     # Check that lock detects bogus (or dead) PID
     runez.write(lock_path, "0\nbar\n", logger=None)
     with SoftLock("foo", give_up=600):
-        lines = list(runez.readlines(lock_path))
-        assert lines[0] == str(os.getpid())  # Lock file replaced with correct stuff
+        assert lock_path.read_text().splitlines()[0] == str(os.getpid())  # Lock file replaced with correct stuff
 
     assert not os.path.exists(lock_path)  # Lock released
 
+    # Lock held by a process that was invoked without any CLI args
+    runez.write(lock_path, str(os.getpid()), logger=None)
+    assert SoftLock("foo")._locked_by() == f"(pid {os.getpid()})"
 
-def test_main(cli):
-    cli.exercise_main("-mpickley", "src/pickley/bstrap.py")
 
+def test_main(cli, monkeypatch):
+    # Exercise `__main__` sections in-process, spawning a python interpreter for each is comparatively slow
+    monkeypatch.setattr(sys, "argv", ["pickley", "--help"])
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_module("pickley", run_name="__main__")
+    assert exc.value.code == 0
 
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_path(os.path.join(cli.project_folder, "src/pickley/bstrap.py"), run_name="__main__")
+    assert exc.value.code == 0
+
+
+@pytest.mark.functional
 def test_package_command(cli):
     # TODO: retire the `package` command, not worth the effort to support it
     if bstrap.USE_UV:
@@ -386,8 +406,7 @@ def test_package_command(cli):
     rp = os.path.realpath("root/usr/local/bin/pickley")
     assert os.path.exists(rp)
     assert runez.is_executable("/tmp/pickley/bin/python")
-    assert runez.is_executable("/tmp/pickley/bin/pickley")
-    assert CFG.program_version("/tmp/pickley/bin/pickley")
+    assert runez.is_executable("/tmp/pickley/bin/pickley")  # Already ran via --sanity-check above
     runez.delete("/tmp/pickley", logger=None)
 
 
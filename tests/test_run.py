@@ -1,7 +1,10 @@
+import pytest
+
 from pickley import bstrap
 from pickley.cli import RunSetup
 
 
+@pytest.mark.functional
 def test_run(cli):
     cli.run("run --help")
     assert cli.succeeded